@@ -0,0 +1,21 @@
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run_event_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a coroutine to completion on uvloop when it is installed, otherwise on the default asyncio loop.
+
+    :param coro: The coroutine to run.
+    :return: The coroutine's result.
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
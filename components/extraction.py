@@ -0,0 +1,73 @@
+# Article text extraction helpers. This module deliberately imports only the HTML parsers,
+# so extraction worker processes start quickly.
+from typing import Any, Dict, List, Optional
+
+import trafilatura
+from selectolax.lexbor import LexborHTMLParser
+
+# Fast-path extractions shorter than this fall back to trafilatura
+_MIN_FAST_EXTRACT_CHARS = 200
+_ARTICLE_CONTAINER_SELECTORS = ("article", "main", "[role=main]", "div#content")
+
+
+def _paragraph_text(paragraphs) -> str:
+    """
+    Joins the non-empty text of the given paragraph nodes, one paragraph per line.
+    """
+    return "\n".join(text for text in (p.text(strip=True) for p in paragraphs) if text)
+
+
+def fast_extract(html_content: str) -> Optional[str]:
+    """
+    Extracts article text with selectolax using a simple boilerplate heuristic: the paragraphs of
+    the largest article-like container, or else the parent element holding the most paragraph text.
+
+    :param html_content: The HTML of the page.
+    :return: Extracted text, or None if the result is shorter than `_MIN_FAST_EXTRACT_CHARS`.
+    """
+    tree = LexborHTMLParser(html_content)
+
+    best = ""
+    for selector in _ARTICLE_CONTAINER_SELECTORS:
+        for node in tree.css(selector):
+            text = _paragraph_text(node.css("p"))
+            if len(text) > len(best):
+                best = text
+
+    if len(best) < _MIN_FAST_EXTRACT_CHARS:
+        # Densest cluster: group paragraphs by their parent element
+        clusters: Dict[int, List[Any]] = {}
+        for p in tree.css("p"):
+            parent = p.parent
+            if parent is not None:
+                clusters.setdefault(parent.mem_id, []).append(p)
+        for paragraphs in clusters.values():
+            text = _paragraph_text(paragraphs)
+            if len(text) > len(best):
+                best = text
+
+    return best if len(best) >= _MIN_FAST_EXTRACT_CHARS else None
+
+
+def trafilatura_extract(html_content: str) -> Optional[str]:
+    """
+    Extracts the main article text from HTML with trafilatura.
+    This is the CPU-heavy fallback that runs in a worker process.
+
+    :param html_content: The HTML of the page.
+    :return: Extracted text or None if nothing could be extracted.
+    """
+    # download_url can also take content directly; fast=True skips the fallback extractors.
+    # Metadata comes from the HN API, so trafilatura's (htmldate-based) metadata extraction is disabled.
+    return trafilatura.extract(
+        html_content,
+        include_comments=False,
+        include_tables=False,
+        include_images=False,
+        with_metadata=False,
+        only_with_metadata=False,
+        deduplicate=True,
+        output_format="txt",
+        favor_precision=True,
+        fast=True,
+    )
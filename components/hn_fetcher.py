@@ -1,13 +1,88 @@
 import asyncio
+import functools
+import hashlib
+import multiprocessing
+import os
+import re
+import sqlite3
+import time
 import aiohttp
-import trafilatura
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+import orjson
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Awaitable, List, Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
 
 from haystack.core.component import component
 from haystack.core.serialization import default_from_dict, default_to_dict
 from haystack.dataclasses import Document
 
+from components.event_loop import run_event_loop
+from components.extraction import fast_extract, trafilatura_extract
+
+# Pages larger than this are not downloaded in full
+_MAX_HTML_BYTES = 2_000_000
+# HTML longer than this is truncated before being handed to trafilatura
+_MAX_PARSE_CHARS = 1_000_000
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+_TRACKING_PARAM_RE = re.compile(r"(?:^|&)(?:utm_[^=&]*|fbclid|gclid)=[^&]*")
+# HTTP cache lifetimes: HN API listings change quickly, article pages rarely do
+_HTTP_CACHE_EXPIRE_AFTER = 6 * 60 * 60
+# Firebase item lookups are retried with exponential backoff on 429s, 5xx and timeouts
+_ITEM_FETCH_RETRIES = 2
+_ITEM_FETCH_BACKOFF = 0.5
+# Per-request budget applied once on the shared session
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3, sock_read=5)
+_HTTP_CACHE_URLS_EXPIRE_AFTER = {
+    "hacker-news.firebaseio.com": 60,
+    "hn.algolia.com": 60,
+}
+
+
+def _is_http_cacheable(response: aiohttp.ClientResponse) -> bool:
+    """
+    Decides from headers alone whether a response may be stored in the HTTP cache.
+    The cache reads the whole body before `_fetch_url` sees it, so article responses are only
+    cached when they would pass its guard: HTML with a known Content-Length within `_MAX_HTML_BYTES`.
+
+    :param response: The response to check.
+    :return: True if the response should be cached.
+    """
+    if response.url.host in _HTTP_CACHE_URLS_EXPIRE_AFTER:
+        return True
+    content_type = response.headers.get("Content-Type", "").lower()
+    return (
+        content_type.startswith(_HTML_CONTENT_TYPES)
+        and response.content_length is not None
+        and response.content_length <= _MAX_HTML_BYTES
+    )
+
+
+def _iso_utc(ts: int) -> str:
+    """
+    Formats a Unix timestamp as an ISO 8601 UTC string, equivalent to
+    ``datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()`` for whole seconds.
+
+    :param ts: The Unix timestamp.
+    :return: The timestamp formatted as ``YYYY-MM-DDTHH:MM:SS+00:00``.
+    """
+    y, mo, d, h, mi, s, *_ = time.gmtime(ts)
+    return f"{y:04d}-{mo:02d}-{d:02d}T{h:02d}:{mi:02d}:{s:02d}+00:00"
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalizes a URL for cache lookups and Document metadata: lowercases the scheme and host,
+    drops the fragment and strips ``utm_*``, ``fbclid`` and ``gclid`` tracking parameters.
+
+    :param url: The URL to canonicalize.
+    :return: The canonical form of the URL.
+    """
+    parts = urlsplit(url)
+    query = _TRACKING_PARAM_RE.sub("", parts.query).lstrip("&")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
 
 @component
 class HackerNewsNewestFetcher:
@@ -16,20 +91,56 @@ class HackerNewsNewestFetcher:
     asynchronously download and extract main article text, and create Haystack Documents.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        max_concurrency: int = 10,
+        cache_path: Optional[str] = "hn_cache.sqlite",
+        cache_ttl: int = 24 * 60 * 60,
+        http_cache_path: Optional[str] = "hn_http_cache.sqlite",
+    ):
         """
         Initializes the HackerNewsNewestFetcher.
 
         :param verbose: If True, prints detailed logs about skipped articles and errors.
+        :param max_concurrency: Maximum number of outbound HTTP requests in flight at once.
+        :param cache_path: Path of the SQLite cache for extracted article text, or None to disable caching.
+        :param cache_ttl: Number of seconds a cached article is considered fresh.
+        :param http_cache_path: Path of the SQLite cache for raw HTTP responses, or None to disable HTTP caching.
         """
         self.hn_api_base = "https://hacker-news.firebaseio.com/v0"
+        self.hn_search_api_base = "https://hn.algolia.com/api/v1"
         self.verbose = verbose
+        self.max_concurrency = max_concurrency
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.http_cache_path = http_cache_path
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self._cache: Optional[sqlite3.Connection] = None
+        if cache_path:
+            self._cache = sqlite3.connect(cache_path)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, fetched_at INT, text TEXT, sha1 BLOB)"
+            )
+            self._cache.execute("CREATE INDEX IF NOT EXISTS articles_sha1 ON articles (sha1)")
+            # Drop expired articles so the cache does not grow without bound
+            self._cache.execute("DELETE FROM articles WHERE fetched_at <= ?", (int(time.time()) - cache_ttl,))
+            self._cache.commit()
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
         """
-        return default_to_dict(self, verbose=self.verbose)
+        return default_to_dict(
+            self,
+            verbose=self.verbose,
+            max_concurrency=self.max_concurrency,
+            cache_path=self.cache_path,
+            cache_ttl=self.cache_ttl,
+            http_cache_path=self.http_cache_path,
+        )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HackerNewsNewestFetcher":
@@ -38,18 +149,121 @@ class HackerNewsNewestFetcher:
         """
         return default_from_dict(cls, data)
 
+    def close(self) -> None:
+        """
+        Shuts down the extraction worker pool and closes the article cache.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def __del__(self):
+        self.close()
+
+    def _get_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """
+        Returns the process pool used for the trafilatura fallback, creating it on first use.
+
+        :param max_workers: Upper bound on worker processes; capped at the CPU count.
+        """
+        if self._pool is None:
+            # The pool is created inside a running, multi-threaded event loop, where forking can deadlock.
+            # A forkserver imports the main module once and forks cheap workers from it; spawn is the
+            # fallback where forkserver is unavailable (Windows).
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+                mp_context.set_forkserver_preload(["__main__", "components.extraction"])
+            else:
+                mp_context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=max(1, min(os.cpu_count() or 1, max_workers)), mp_context=mp_context
+            )
+        return self._pool
+
+    def _cache_get(self, url: str) -> Optional[str]:
+        """
+        Looks up previously extracted article text for a canonical URL.
+
+        :param url: The canonical article URL.
+        :return: The cached text, or None on a cache miss or expired entry.
+        """
+        if self._cache is None:
+            return None
+        row = self._cache.execute(
+            "SELECT text FROM articles WHERE url = ? AND fetched_at > ?",
+            (url, int(time.time()) - self.cache_ttl),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _cache_put(self, url: str, text: str, digest: bytes) -> None:
+        """
+        Stores extracted article text for a canonical URL.
+
+        :param url: The canonical article URL.
+        :param text: The extracted article text.
+        :param digest: SHA-1 digest of the text.
+        """
+        if self._cache is None:
+            return
+        self._cache.execute(
+            "INSERT OR REPLACE INTO articles (url, fetched_at, text, sha1) VALUES (?, ?, ?, ?)",
+            (url, int(time.time()), text, digest),
+        )
+        self._cache.commit()
+
+    def _is_duplicate(self, url: str, digest: bytes) -> bool:
+        """
+        Checks whether identical article text was cached earlier under a different URL.
+
+        :param url: The canonical article URL.
+        :param digest: SHA-1 digest of the article text.
+        :return: True if another, earlier-cached URL has the same content.
+        """
+        if self._cache is None:
+            return False
+        row = self._cache.execute(
+            "SELECT 1 FROM articles WHERE sha1 = ? AND url != ? AND fetched_at > ? "
+            "AND rowid < (SELECT rowid FROM articles WHERE url = ?) LIMIT 1",
+            (digest, url, int(time.time()) - self.cache_ttl, url),
+        ).fetchone()
+        return row is not None
+
     async def _fetch_url(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
         """
-        Asynchronously fetches content from a given URL.
+        Asynchronously fetches HTML content from a given URL.
+        Non-HTML responses (PDFs, videos, ...) are skipped and bodies are capped at `_MAX_HTML_BYTES`.
 
         :param session: aiohttp client session.
         :param url: The URL to fetch.
-        :return: The text content of the response, or None if an error occurs.
+        :return: The text content of the response, or None if an error occurs or the response is not HTML.
         """
         try:
-            async with session.get(url, timeout=10) as response:
-                response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
-                return await response.text()
+            async with self._sem:
+                async with session.get(url) as response:
+                    response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
+
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    if not content_type.startswith(_HTML_CONTENT_TYPES):
+                        if self.verbose:
+                            print(f"DEBUG: Skipping {url} (non-HTML content type '{content_type}')")
+                        return None
+                    if response.content_length is not None and response.content_length > _MAX_HTML_BYTES:
+                        if self.verbose:
+                            print(f"DEBUG: Skipping {url} (page too large: {response.content_length} bytes)")
+                        return None
+
+                    # StreamReader.read(n) only returns what is buffered, so read chunks until EOF or the cap
+                    chunks = []
+                    remaining = _MAX_HTML_BYTES
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        chunks.append(chunk[:remaining])
+                        remaining -= len(chunk)
+                        if remaining <= 0:
+                            break
+                    return b"".join(chunks).decode(response.charset or "utf-8", errors="replace")
         except aiohttp.ClientError as e:
             if self.verbose:
                 print(f"DEBUG: Failed to fetch {url}: {e}")
@@ -65,7 +279,7 @@ class HackerNewsNewestFetcher:
 
     async def _extract_article_text(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
         """
-        Asynchronously downloads a webpage and extracts the main article text using trafilatura.
+        Asynchronously downloads a webpage and extracts the main article text using selectolax or trafilatura.
 
         :param session: aiohttp client session.
         :param url: The URL of the article.
@@ -75,17 +289,26 @@ class HackerNewsNewestFetcher:
         if not html_content:
             return None
 
+        if len(html_content) > _MAX_PARSE_CHARS:
+            html_content = html_content[:_MAX_PARSE_CHARS]
+
         try:
-            # download_url can also take content directly
-            extracted_text = trafilatura.extract(html_content, include_comments=False, output_format="txt")
+            # The selectolax fast path is cheap enough to run in-process
+            extracted_text = fast_extract(html_content)
+            if not extracted_text:
+                # Run the heavier trafilatura fallback in a worker process so the event loop keeps servicing requests
+                loop = asyncio.get_running_loop()
+                extracted_text = await loop.run_in_executor(
+                    self._get_pool(self.max_concurrency), trafilatura_extract, html_content
+                )
             if not extracted_text:
                 if self.verbose:
-                    print(f"DEBUG: Trafilatura could not extract content from {url}")
+                    print(f"DEBUG: Could not extract content from {url}")
                 return None
             return extracted_text
         except Exception as e:
             if self.verbose:
-                print(f"DEBUG: Error extracting text with trafilatura from {url}: {e}")
+                print(f"DEBUG: Error extracting text from {url}: {e}")
             return None
 
     async def _fetch_story_details(self, session: aiohttp.ClientSession, story_id: int) -> Optional[Dict[str, Any]]:
@@ -97,106 +320,319 @@ class HackerNewsNewestFetcher:
         :return: A dictionary containing story details or None if fetching fails.
         """
         url = f"{self.hn_api_base}/item/{story_id}.json"
+        for attempt in range(_ITEM_FETCH_RETRIES + 1):
+            retry_delay = _ITEM_FETCH_BACKOFF * 2**attempt
+            can_retry = attempt < _ITEM_FETCH_RETRIES
+            try:
+                async with self._sem:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+            except aiohttp.ClientResponseError as e:
+                # Back off on rate limiting and transient server errors instead of dropping the story
+                if can_retry and (e.status == 429 or e.status >= 500):
+                    await asyncio.sleep(retry_delay)
+                    continue
+                if self.verbose:
+                    print(f"DEBUG: Failed to fetch story details for ID {story_id}: {e}")
+                return None
+            except aiohttp.ClientError as e:
+                if self.verbose:
+                    print(f"DEBUG: Failed to fetch story details for ID {story_id}: {e}")
+                return None
+            except asyncio.TimeoutError:
+                if can_retry:
+                    await asyncio.sleep(retry_delay)
+                    continue
+                if self.verbose:
+                    print(f"DEBUG: Timeout fetching story details for ID {story_id}")
+                return None
+            except Exception as e:
+                if self.verbose:
+                    print(f"DEBUG: Unexpected error fetching story details for ID {story_id}: {e}")
+                return None
+        return None
+
+    async def _fetch_newest_batch(self, session: aiohttp.ClientSession, last_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Asynchronously fetches the newest K stories in a single request via the HN Algolia search API.
+
+        :param session: aiohttp client session.
+        :param last_k: The number of newest stories to fetch.
+        :return: A list of story details shaped like Firebase items, or None if fetching fails.
+        """
+        url = f"{self.hn_search_api_base}/search_by_date"
+        params = {"tags": "story", "hitsPerPage": str(last_k)}
         try:
-            async with session.get(url, timeout=5) as response:
-                response.raise_for_status()
-                return await response.json()
+            async with self._sem:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    payload = orjson.loads(await response.read())
         except aiohttp.ClientError as e:
             if self.verbose:
-                print(f"DEBUG: Failed to fetch story details for ID {story_id}: {e}")
+                print(f"DEBUG: Failed to fetch newest stories from Algolia: {e}")
             return None
         except asyncio.TimeoutError:
             if self.verbose:
-                print(f"DEBUG: Timeout fetching story details for ID {story_id}")
+                print("DEBUG: Timeout fetching newest stories from Algolia")
             return None
         except Exception as e:
             if self.verbose:
-                print(f"DEBUG: Unexpected error fetching story details for ID {story_id}: {e}")
+                print(f"DEBUG: Unexpected error fetching newest stories from Algolia: {e}")
             return None
 
-    async def _process_story(self, session: aiohttp.ClientSession, story_id: int) -> Optional[Document]:
+        # Map Algolia hits onto the Firebase item schema expected by _process_story
+        stories = []
+        for hit in payload.get("hits", []):
+            try:
+                story_id = int(hit["objectID"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            story = {
+                "id": story_id,
+                "type": "story",
+                "title": hit.get("title"),
+                "url": hit.get("url"),
+                "score": hit.get("points") or 0,
+                "descendants": hit.get("num_comments") or 0,
+                "by": hit.get("author"),
+            }
+            if hit.get("created_at_i") is not None:
+                story["time"] = hit["created_at_i"]
+            stories.append(story)
+        return stories
+
+    async def _fetch_newest_ids(self, session: aiohttp.ClientSession, last_k: int) -> Optional[List[int]]:
+        """
+        Asynchronously fetches the newest story IDs from the Hacker News Firebase API.
+
+        :param session: aiohttp client session.
+        :param last_k: The number of newest story IDs to return.
+        :return: A list of story IDs, or None if fetching fails.
+        """
+        url = f"{self.hn_api_base}/newstories.json"
+        try:
+            async with self._sem:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    story_ids = orjson.loads(await response.read())
+        except aiohttp.ClientError as e:
+            if self.verbose:
+                print(f"ERROR: Failed to fetch top story IDs: {e}")
+            return None
+        except asyncio.TimeoutError:
+            if self.verbose:
+                print("ERROR: Timeout fetching top story IDs.")
+            return None
+        except Exception as e:
+            if self.verbose:
+                print(f"ERROR: Unexpected error fetching top story IDs: {e}")
+            return None
+        return story_ids[:last_k]
+
+    async def _process_story(
+        self, session: aiohttp.ClientSession, story_id: int, details: Optional[Dict[str, Any]] = None
+    ) -> Optional[Document]:
         """
         Fetches story details, extracts article text (if available), and creates a Document.
 
         :param session: aiohttp client session.
         :param story_id: The ID of the Hacker News story.
+        :param details: Pre-fetched story details; if omitted they are fetched from the Firebase API.
         :return: A Haystack Document or None if the story is skipped or processing fails.
         """
-        details = await self._fetch_story_details(session, story_id)
+        if details is None:
+            details = await self._fetch_story_details(session, story_id)
         if not details or details.get("type") != "story":
             if self.verbose:
                 print(f"SKIPPED: ID {story_id} (not a story or details missing)")
             return None
 
         # Skip Ask HN, jobs, polls, text-only posts without external URL
-        if "url" not in details or not details["url"]:
+        details_get = details.get
+        url = details_get("url")
+        if not url:
             if self.verbose:
-                print(f"SKIPPED: '{details.get('title', 'N/A')}' (ID: {story_id}) - No external URL")
+                print(f"SKIPPED: '{details_get('title', 'N/A')}' (ID: {story_id}) - No external URL")
             return None
 
         # Convert Unix timestamp to ISO 8601 string
-        time_iso = datetime.fromtimestamp(details["time"], tz=timezone.utc).isoformat() if "time" in details else None
+        time_iso = _iso_utc(details["time"]) if "time" in details else None
 
-        article_text = await self._extract_article_text(session, details["url"])
+        canonical_url = _canonicalize_url(url)
+        article_text = self._cache_get(canonical_url)
+        cache_hit = article_text is not None
+        if cache_hit:
+            if self.verbose:
+                print(f"DEBUG: Cache hit for {url}")
+        else:
+            article_text = await self._extract_article_text(session, url)
 
         if not article_text:
             if self.verbose:
-                print(f"SKIPPED: '{details.get('title', 'N/A')}' (ID: {story_id}) - Could not extract article text or content was empty")
+                print(f"SKIPPED: '{details_get('title', 'N/A')}' (ID: {story_id}) - Could not extract article text or content was empty")
+            return None
+
+        digest = hashlib.sha1(article_text.encode("utf-8")).digest()
+        if not cache_hit:
+            self._cache_put(canonical_url, article_text, digest)
+
+        # Suppress reposts of the same content under a different URL
+        if self._is_duplicate(canonical_url, digest):
+            if self.verbose:
+                print(f"SKIPPED: '{details_get('title', 'N/A')}' (ID: {story_id}) - Duplicate of previously seen article content")
             return None
 
         # Create Haystack Document
         metadata = {
-            "title": details.get("title"),
-            "url": details["url"],
-            "score": details.get("score", 0),
-            "descendants": details.get("descendants", 0),  # comment count
-            "by": details.get("by"),
+            "title": details_get("title"),
+            "url": canonical_url,
+            "score": details_get("score", 0),
+            "descendants": details_get("descendants", 0),  # comment count
+            "by": details_get("by"),
             "time_iso": time_iso,
             "id": story_id,
         }
         return Document(content=article_text, meta=metadata)
 
-    async def _run_async(self, last_k: int = 5):
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Creates the client session shared by every request of a run.
+        Unless disabled, responses are cached on disk and ETag/Last-Modified headers are honored.
+
+        :return: An aiohttp client session with a bounded, pooled connector.
         """
-        Internal async method to fetch and process stories.
+        # Bound parallelism and pool connections/DNS lookups across the whole run
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        )
+        if not self.http_cache_path:
+            return aiohttp.ClientSession(connector=connector, timeout=_REQUEST_TIMEOUT)
 
+        cache = SQLiteBackend(
+            cache_name=self.http_cache_path,
+            expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+            urls_expire_after=_HTTP_CACHE_URLS_EXPIRE_AFTER,
+            cache_control=True,
+            filter_fn=_is_http_cacheable,
+        )
+        return CachedSession(cache=cache, connector=connector, timeout=_REQUEST_TIMEOUT)
+
+    async def _story_tasks(
+        self, session: aiohttp.ClientSession, last_k: int
+    ) -> Optional[List[Awaitable[Optional[Document]]]]:
+        """
+        Fetches the newest stories and prepares one processing coroutine per story.
+
+        :param session: aiohttp client session.
         :param last_k: The number of newest stories to fetch.
-        :return: A dictionary containing a list of Haystack Documents.
+        :return: A list of coroutines producing Documents, or None if the story list could not be fetched.
+        """
+        # Prefer a single Algolia request; fall back to per-item Firebase fetches
+        stories = await self._fetch_newest_batch(session, last_k)
+        if stories is not None:
+            return [self._process_story(session, story["id"], story) for story in stories]
+
+        if self.verbose:
+            print("DEBUG: Falling back to the Firebase API for newest stories")
+        story_ids_to_process = await self._fetch_newest_ids(session, last_k)
+        if story_ids_to_process is None:
+            return None
+        return [self._process_story(session, story_id) for story_id in story_ids_to_process]
+
+    async def _run_async(self, last_k: int = 5) -> AsyncIterator[Document]:
+        """
+        Internal async generator that fetches and processes stories,
+        yielding each Document as soon as it is ready.
+
+        :param last_k: The number of newest stories to fetch.
+        :return: An async iterator of Haystack Documents in completion order.
         """
-        async with aiohttp.ClientSession() as session:
+        # Start the extraction workers now so their startup overlaps the story list request
+        self._get_pool(last_k).submit(int)
+
+        async with self._create_session() as session:
+            story_coros = await self._story_tasks(session, last_k)
+            if story_coros is None:
+                return
+
+            # Own the tasks so they can be cancelled if the consumer stops early or the deadline fires
+            tasks = [asyncio.create_task(coro) for coro in story_coros]
             try:
-                # Fetch top story IDs
-                top_stories_url = f"{self.hn_api_base}/newstories.json"
-                async with session.get(top_stories_url, timeout=5) as response:
-                    response.raise_for_status()
-                    top_story_ids = await response.json()
-            except aiohttp.ClientError as e:
-                if self.verbose:
-                    print(f"ERROR: Failed to fetch top story IDs: {e}")
-                return {"documents": []}
-            except asyncio.TimeoutError:
-                if self.verbose:
-                    print("ERROR: Timeout fetching top story IDs.")
-                return {"documents": []}
-            except Exception as e:
+                # Yield documents as they finish so slow outliers do not hold back the rest
+                produced = 0
+                for next_done in asyncio.as_completed(tasks):
+                    doc = await next_done
+                    # Skipped stories produce None
+                    if doc is not None:
+                        produced += 1
+                        yield doc
+
                 if self.verbose:
-                    print(f"ERROR: Unexpected error fetching top story IDs: {e}")
-                return {"documents": []}
+                    print(f"Finished fetching. Processed {produced} out of {last_k} requested stories.")
+            finally:
+                # Stop in-flight stories before the session is closed
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
-            # Limit to last_k stories and create tasks for parallel processing
-            story_ids_to_process = top_story_ids[:last_k]
-            tasks = [self._process_story(session, story_id) for story_id in story_ids_to_process]
+    async def stream_documents(self, last_k: int, queue: "asyncio.Queue[Document]") -> int:
+        """
+        Fetches and processes stories, putting each Document on `queue` as soon as it is ready.
+        Stops early, keeping what was already produced, once the run deadline is exceeded.
 
-            # Run tasks concurrently
-            processed_documents = await asyncio.gather(*tasks)
+        :param last_k: The number of newest stories to fetch.
+        :param queue: The queue receiving the processed Documents.
+        :return: The number of Documents produced.
+        """
+        produced = 0
 
-            # Filter out None values (skipped stories)
-            documents = [doc for doc in processed_documents if doc is not None]
+        async def forward() -> None:
+            nonlocal produced
+            async for doc in self._run_async(last_k):
+                produced += 1
+                await queue.put(doc)
 
-            if self.verbose:
-                print(f"Finished fetching. Processed {len(documents)} out of {last_k} requested stories.")
+        await self._with_deadline(forward(), last_k)
+        return produced
+
+    async def _collect_documents(self, last_k: int) -> List[Document]:
+        """
+        Gathers every Document produced by `_run_async` into a list.
+        Stops early, keeping what was already collected, once the run deadline is exceeded.
+
+        :param last_k: The number of newest stories to fetch.
+        :return: The list of Haystack Documents.
+        """
+        documents: List[Document] = []
+
+        async def collect() -> None:
+            async for doc in self._run_async(last_k):
+                documents.append(doc)
 
-            return {"documents": documents}
+        await self._with_deadline(collect(), last_k)
+        return documents
+
+    async def _with_deadline(self, coro: Awaitable[None], last_k: int) -> None:
+        """
+        Awaits `coro` under a total deadline that scales with the number of stories,
+        so a hung host cannot stall the whole run.
+
+        :param coro: The coroutine to await.
+        :param last_k: The number of newest stories being fetched.
+        """
+        deadline = last_k * 2 + 10
+        try:
+            await asyncio.wait_for(coro, timeout=deadline)
+        except asyncio.TimeoutError:
+            if self.verbose:
+                print(f"ERROR: Fetching did not finish within {deadline} seconds; keeping stories processed so far.")
 
     @component.output_types(documents=List[Document])
     def run(self, last_k: int = 5):
@@ -206,4 +642,4 @@ class HackerNewsNewestFetcher:
         :param last_k: The number of newest stories to fetch.
         :return: A dictionary containing a list of Haystack Documents.
         """
-        return asyncio.run(self._run_async(last_k))
+        return {"documents": run_event_loop(self._collect_documents(last_k))}
@@ -1,18 +1,29 @@
 import asyncio
+import io
 import os
 import time
-import json
+import orjson
+from functools import partial
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 import click
 from dotenv import load_dotenv
 
-from pipeline import create_hn_summarizer_pipeline
+from components.event_loop import run_event_loop
+from components.hn_fetcher import HackerNewsNewestFetcher
+from pipeline import DocumentLoopProcessor, create_hn_summarizer_components, stream_hn_summaries
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Precomputed styles for the pretty output
+_style_header = partial(click.style, fg="cyan", bold=True)
+_style_separator = partial(click.style, fg="bright_black")
+_style_title = partial(click.style, fg="bright_green", bold=True)
+_style_stats = partial(click.style, fg="bright_yellow")
+_style_url = partial(click.style, fg="bright_blue", underline=True)
+
 @click.command()
 @click.option(
     "--last-k",
@@ -35,6 +46,20 @@ load_dotenv()
     help="Temperature for the OpenAI model (0.0 to 1.0).",
     show_default=True,
 )
+@click.option(
+    "--max-concurrency",
+    default=10,
+    type=click.IntRange(1, 50),
+    help="Maximum number of concurrent HTTP requests and LLM calls.",
+    show_default=True,
+)
+@click.option(
+    "--batch-size",
+    default=5,
+    type=click.IntRange(1, 20),
+    help="Maximum number of stories summarized per OpenAI request.",
+    show_default=True,
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -42,17 +67,21 @@ load_dotenv()
 )
 @click.option(
     "--json",
+    "json_out",
     is_flag=True,
     help="Output machine-readable JSON array instead of pretty text.",
 )
-def main(last_k: int, model: str, temperature: float, verbose: bool, json: bool):
+def main(last_k: int, model: str, temperature: float, max_concurrency: int, batch_size: int, verbose: bool, json_out: bool):
     """
     Hacker News Summarizer CLI: Fetches the newest K stories, extracts article text,
     and generates concise one-sentence summaries using Haystack 2.x and OpenAI.
     """
     if verbose:
         click.echo(f"🚀 Starting Hacker News Summarizer (verbose mode enabled)")
-        click.echo(f"Parameters: last_k={last_k}, model='{model}', temperature={temperature}")
+        click.echo(
+            f"Parameters: last_k={last_k}, model='{model}', temperature={temperature}, "
+            f"max_concurrency={max_concurrency}, batch_size={batch_size}"
+        )
 
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
@@ -68,14 +97,16 @@ def main(last_k: int, model: str, temperature: float, verbose: bool, json: bool)
 
     start_time = time.monotonic()
 
-    # Create the Haystack pipeline
-    pipeline = create_hn_summarizer_pipeline(openai_api_key, model, temperature, verbose)
+    # Create the fetcher and summarizer components
+    fetcher, processor = create_hn_summarizer_components(
+        openai_api_key, model, temperature, verbose, max_concurrency, batch_size
+    )
 
     try:
-        # Run the pipeline
+        # Stream summaries as they are generated
         if verbose:
             click.echo("Fetching and processing Hacker News stories...")
-        result = pipeline.run(data={"hn_fetcher": {"last_k": last_k}})
+        summaries = run_event_loop(_collect_summaries(fetcher, processor, last_k, echo_pretty=not json_out))
 
     except Exception as e:
         click.echo(
@@ -83,72 +114,91 @@ def main(last_k: int, model: str, temperature: float, verbose: bool, json: bool)
             err=True,
         )
         raise click.Abort()
-
-    summaries: List[Dict[str, Any]] = []
-    # Extract results and format them
-    if "document_processor" in result and "results" in result["document_processor"]:
-        for item in result["document_processor"]["results"]:
-            document = item.get("document")
-            summary_text = item.get("summary", "N/A")
-
-            # Ensure 'document.meta' exists and contains necessary keys
-            title = document.meta.get("title", "N/A")
-            url = document.meta.get("url", "N/A")
-            score = document.meta.get("score", 0)
-            comments = document.meta.get("descendants", 0)
-            time_iso = document.meta.get("time_iso", "N/A")
-            by = document.meta.get("by", "N/A")
-
-            summaries.append(
-                {
-                    "title": title,
-                    "url": url,
-                    "score": score,
-                    "comments": comments,
-                    "summary": summary_text,
-                    "time_iso": time_iso,
-                    "by": by,
-                }
-            )
+    finally:
+        fetcher.close()
 
     end_time = time.monotonic()
     duration = end_time - start_time
 
-    if verbose:
-        click.echo(f"Total execution time: {duration:.2f} seconds")
-
-    if json:
-        click.echo(json.dumps(summaries, indent=2))
+    if json_out:
+        click.echo(orjson.dumps(summaries, option=orjson.OPT_INDENT_2).decode())
     else:
         if summaries:
-            click.echo()
-            click.echo(click.style("━━━ Hacker News Summaries ━━━", fg="cyan", bold=True))
-            click.echo()
-            
-            for i, item in enumerate(summaries, 1):
-                # Post number and title
-                click.echo(click.style(f"{i}. {item['title']}", fg='bright_green', bold=True))
-                
-                # Score and comments
-                click.echo(click.style(f"   ({item['score']} points, {item['comments']} comments)", fg='bright_yellow'))
-                
-                # Summary text
-                click.echo(f"   {item['summary']}")
-                
-                # URL
-                click.echo(click.style(f"   {item['url']}", fg='bright_blue', underline=True))
-                
-                # Separator between posts (except after the last one)
-                if i < len(summaries):
-                    click.echo()
-                    click.echo(click.style("─" * 70, fg='bright_black'))
-                    click.echo()
-            
-            click.echo()
-            click.echo(click.style("━━━━━━━━━━━━━━━━━━━━━━━━━━━━", fg="cyan", bold=True))
+            click.echo("\n" + _style_header("━━━━━━━━━━━━━━━━━━━━━━━━━━━━"))
         else:
             click.echo(click.style("No summaries generated. Try increasing --last-k or check verbose output for skipped articles.", fg="yellow"))
 
+    if verbose:
+        click.echo(f"Total execution time: {duration:.2f} seconds")
+
+
+async def _collect_summaries(
+    fetcher: HackerNewsNewestFetcher,
+    processor: DocumentLoopProcessor,
+    last_k: int,
+    echo_pretty: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Consumes the summary stream, optionally printing each summary as soon as it arrives.
+
+    :param fetcher: The component producing Documents.
+    :param processor: The component summarizing Documents.
+    :param last_k: The number of newest stories to fetch.
+    :param echo_pretty: If True, print each summary in the pretty text format as it arrives.
+    :return: The list of formatted summaries in arrival order.
+    """
+    summaries: List[Dict[str, Any]] = []
+    append = summaries.append
+    async for item in stream_hn_summaries(fetcher, processor, last_k):
+        # Bind the meta lookup once; missing keys fall back to defaults
+        meta_get = item["document"].meta.get
+        append(
+            {
+                "title": meta_get("title", "N/A"),
+                "url": meta_get("url", "N/A"),
+                "score": meta_get("score", 0),
+                "comments": meta_get("descendants", 0),
+                "summary": item.get("summary", "N/A"),
+                "time_iso": meta_get("time_iso", "N/A"),
+                "by": meta_get("by", "N/A"),
+            }
+        )
+
+        if echo_pretty:
+            _echo_summary(len(summaries), summaries[-1])
+
+    return summaries
+
+
+def _echo_summary(i: int, item: Dict[str, Any]) -> None:
+    """
+    Prints a single summary in the pretty text format.
+
+    :param i: The 1-based position of the summary in the output.
+    :param item: The formatted summary.
+    """
+    buf = io.StringIO()
+    if i == 1:
+        buf.write("\n" + _style_header("━━━ Hacker News Summaries ━━━") + "\n\n")
+    else:
+        # Separator between posts
+        buf.write("\n" + _style_separator("─" * 70) + "\n\n")
+
+    # Post number and title
+    buf.write(_style_title(f"{i}. {item['title']}") + "\n")
+    
+    # Score and comments
+    buf.write(_style_stats(f"   ({item['score']} points, {item['comments']} comments)") + "\n")
+    
+    # Summary text
+    buf.write(f"   {item['summary']}\n")
+    
+    # URL
+    buf.write(_style_url(f"   {item['url']}") + "\n")
+
+    # Emit the whole post with a single write
+    click.echo(buf.getvalue(), nl=False)
+
 
 if __name__ == "__main__":
     main()
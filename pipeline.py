@@ -1,65 +1,243 @@
+import asyncio
+import orjson
 from haystack import Pipeline
 from haystack.components.builders import PromptBuilder
 from haystack.components.generators.openai import OpenAIGenerator
 from haystack.utils import Secret
+from components.event_loop import run_event_loop
 from components.hn_fetcher import HackerNewsNewestFetcher
 import os
 from pathlib import Path
 from haystack.core.component import component
 from haystack.dataclasses import Document
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
+# How long a streaming consumer waits for more documents to fill a batch before calling the LLM
+_BATCH_FILL_TIMEOUT = 1.0
+
 @component
 class DocumentLoopProcessor:
-    """Process each document individually through the LLM."""
-    def __init__(self, api_key: str, model_name: str, temperature: float, verbose: bool = False):
+    """
+    Summarize documents through the LLM, packing up to `batch_size` documents into each call
+    and running up to `max_concurrency` calls at once.
+    """
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        temperature: float,
+        verbose: bool = False,
+        max_concurrency: int = 10,
+        batch_size: int = 5,
+    ):
         self.api_key = api_key
         self.model_name = model_name
         self.temperature = temperature
         self.verbose = verbose
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+
+        # Build the prompt builders and generator once and reuse them for every document
+        prompts_dir = Path(__file__).parent / "prompts"
+        self._template = (prompts_dir / "hn_summary.j2").read_text()
+        self._prompt_builder = PromptBuilder(template=self._template, required_variables=["doc"])
+        self._batch_template = (prompts_dir / "hn_summary_batch.j2").read_text()
+        self._batch_prompt_builder = PromptBuilder(template=self._batch_template, required_variables=["docs"])
+        self._llm = OpenAIGenerator(
+            model=self.model_name,
+            api_key=Secret.from_token(self.api_key),
+            generation_kwargs={"temperature": self.temperature},
+        )
     
+    async def summarize(self, doc: Document) -> Dict[str, Any]:
+        """Generate the summary for a single document."""
+        try:
+            # Create prompt for single document
+            prompt = self._prompt_builder.run(doc=doc)["prompt"]
+            
+            # Generate summary using LLM; the blocking HTTP call runs in a worker thread
+            response = await asyncio.to_thread(self._llm.run, prompt=prompt)
+            summary = response["replies"][0] if response.get("replies") else "Unable to generate summary"
+            
+            return {
+                "document": doc,
+                "summary": summary
+            }
+        except Exception as e:
+            if self.verbose:
+                print(f"DEBUG: Error processing document '{doc.meta.get('title', 'N/A')}': {e}")
+            return {
+                "document": doc,
+                "summary": "Error generating summary"
+            }
+
+    async def summarize_batch(self, docs: List[Document]) -> List[Dict[str, Any]]:
+        """
+        Generate summaries for several documents with a single LLM call, falling back to
+        per-document calls for any document the JSON reply does not cover.
+        """
+        if len(docs) == 1:
+            return [await self.summarize(docs[0])]
+
+        summaries: Dict[int, str] = {}
+        try:
+            prompt = self._batch_prompt_builder.run(docs=docs)["prompt"]
+            response = await asyncio.to_thread(self._llm.run, prompt=prompt)
+            summaries = self._parse_batch_reply(response["replies"][0], len(docs))
+        except Exception as e:
+            if self.verbose:
+                print(f"DEBUG: Error processing batch of {len(docs)} documents, retrying individually: {e}")
+
+        # Summarize the documents the reply left out concurrently rather than one call at a time
+        missing = [i for i in range(len(docs)) if i not in summaries]
+        retried = dict(zip(missing, await asyncio.gather(*(self.summarize(docs[i]) for i in missing))))
+        return [
+            retried[i] if i in retried else {"document": doc, "summary": summaries[i]}
+            for i, doc in enumerate(docs)
+        ]
+
+    @staticmethod
+    def _parse_batch_reply(reply: str, num_docs: int) -> Dict[int, str]:
+        """Parse a `{"summaries": [{"id": ..., "summary": ...}]}` reply into a map of post index to summary."""
+        reply = reply.strip()
+        if reply.startswith("```"):
+            # Drop a Markdown code fence around the JSON
+            reply = reply.strip("`").removeprefix("json").strip()
+
+        summaries = {}
+        for entry in orjson.loads(reply)["summaries"]:
+            post_id = int(entry["id"])
+            summary = entry.get("summary")
+            if 0 <= post_id < num_docs and isinstance(summary, str) and summary:
+                summaries[post_id] = summary
+        return summaries
+
+    async def _summarize(self, docs: List[Document], sem: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Generate the summaries for a batch of documents while holding the concurrency semaphore."""
+        async with sem:
+            return await self.summarize_batch(docs)
+
+    async def _run_async(self, documents: List[Document]) -> List[Dict[str, Any]]:
+        """Summarize all documents in concurrent batches, preserving input order."""
+        sem = asyncio.Semaphore(self.max_concurrency)
+        batches = [documents[i:i + self.batch_size] for i in range(0, len(documents), self.batch_size)]
+        batch_results = await asyncio.gather(*(self._summarize(batch, sem) for batch in batches))
+        return [result for results in batch_results for result in results]
+
     @component.output_types(results=List[dict])
     def run(self, documents: List[Document]):
         """Process each document and return results with documents and summaries."""
-        from haystack.components.builders import PromptBuilder
-        from haystack.components.generators.openai import OpenAIGenerator
-        
-        template_path = Path(__file__).parent / "prompts" / "hn_summary.j2"
-        with open(template_path, "r") as f:
-            template = f.read()
-        
-        results = []
-        for doc in documents:
-            try:
-                # Create prompt for single document
-                prompt_builder = PromptBuilder(template=template, required_variables=["doc"])
-                prompt = prompt_builder.run(doc=doc)["prompt"]
-                
-                # Generate summary using LLM
-                llm = OpenAIGenerator(
-                    model=self.model_name,
-                    api_key=Secret.from_token(self.api_key),
-                    generation_kwargs={"temperature": self.temperature},
-                )
-                response = llm.run(prompt=prompt)
-                summary = response["replies"][0] if response.get("replies") else "Unable to generate summary"
-                
-                results.append({
-                    "document": doc,
-                    "summary": summary
-                })
-            except Exception as e:
-                if self.verbose:
-                    print(f"DEBUG: Error processing document '{doc.meta.get('title', 'N/A')}': {e}")
-                results.append({
-                    "document": doc,
-                    "summary": "Error generating summary"
-                })
-        
-        return {"results": results}
-
-def create_hn_summarizer_pipeline(api_key: str, model_name: str, temperature: float, verbose: bool = False) -> Pipeline:
+        return {"results": run_event_loop(self._run_async(documents))}
+
+def create_hn_summarizer_components(
+    api_key: str,
+    model_name: str,
+    temperature: float,
+    verbose: bool = False,
+    max_concurrency: int = 10,
+    batch_size: int = 5,
+) -> Tuple[HackerNewsNewestFetcher, DocumentLoopProcessor]:
+    """
+    Creates the fetcher and summarizer components used for Hacker News summarization.
+
+    :param api_key: OpenAI API key.
+    :param model_name: The OpenAI model to use for generation.
+    :param temperature: The temperature for the OpenAI model.
+    :param verbose: If True, enable verbose logging for components.
+    :param max_concurrency: Maximum number of concurrent HTTP requests and LLM calls.
+    :param batch_size: Maximum number of documents summarized per LLM call.
+    :return: A `(fetcher, processor)` tuple.
+    """
+    fetcher = HackerNewsNewestFetcher(verbose=verbose, max_concurrency=max_concurrency)
+    processor = DocumentLoopProcessor(
+        api_key=api_key,
+        model_name=model_name,
+        temperature=temperature,
+        verbose=verbose,
+        max_concurrency=max_concurrency,
+        batch_size=batch_size,
+    )
+    return fetcher, processor
+
+async def stream_hn_summaries(
+    fetcher: HackerNewsNewestFetcher, processor: DocumentLoopProcessor, last_k: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fetches stories and summarizes them in a single producer/consumer run, yielding each
+    result as soon as its summary is ready so LLM calls overlap with crawling.
+
+    :param fetcher: The component producing Documents.
+    :param processor: The component summarizing Documents.
+    :param last_k: The number of newest stories to fetch.
+    :return: An async iterator of `{"document": ..., "summary": ...}` dictionaries in completion order.
+    """
+    # One consumer per allowed LLM call, matching the semaphore used by `DocumentLoopProcessor.run`
+    num_consumers = max(1, processor.max_concurrency)
+    documents: "asyncio.Queue[Optional[Document]]" = asyncio.Queue()
+    results: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            await fetcher.stream_documents(last_k, documents)
+        finally:
+            # One sentinel per consumer signals the end of the stream
+            for _ in range(num_consumers):
+                await documents.put(None)
+
+    # Only one consumer fills a batch at a time, so idle consumers do not split arriving documents
+    fill_lock = asyncio.Lock()
+
+    async def next_batch() -> Tuple[List[Document], bool]:
+        """Collect up to `batch_size` documents, waiting briefly to fill the batch; also report end of stream."""
+        async with fill_lock:
+            doc = await documents.get()
+            if doc is None:
+                return [], True
+            batch = [doc]
+            loop = asyncio.get_running_loop()
+            fill_deadline = loop.time() + _BATCH_FILL_TIMEOUT
+            while len(batch) < processor.batch_size:
+                try:
+                    next_doc = await asyncio.wait_for(documents.get(), timeout=fill_deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if next_doc is None:
+                    return batch, True
+                batch.append(next_doc)
+            return batch, False
+
+    async def consume() -> None:
+        done = False
+        while not done:
+            batch, done = await next_batch()
+            if batch:
+                for result in await processor.summarize_batch(batch):
+                    await results.put(result)
+
+    async def run_all() -> None:
+        try:
+            await asyncio.gather(produce(), *(consume() for _ in range(num_consumers)))
+        finally:
+            await results.put(None)
+
+    runner = asyncio.create_task(run_all())
+    try:
+        while (item := await results.get()) is not None:
+            yield item
+        # Surface any error raised by the producer or consumers
+        await runner
+    finally:
+        runner.cancel()
+
+def create_hn_summarizer_pipeline(
+    api_key: str,
+    model_name: str,
+    temperature: float,
+    verbose: bool = False,
+    max_concurrency: int = 10,
+    batch_size: int = 5,
+) -> Pipeline:
     """
     Creates and returns a Haystack Pipeline for Hacker News summarization.
 
@@ -67,20 +245,20 @@ def create_hn_summarizer_pipeline(api_key: str, model_name: str, temperature: fl
     :param model_name: The OpenAI model to use for generation.
     :param temperature: The temperature for the OpenAI model.
     :param verbose: If True, enable verbose logging for components.
+    :param max_concurrency: Maximum number of concurrent HTTP requests and LLM calls.
+    :param batch_size: Maximum number of documents summarized per LLM call.
     :return: A Haystack Pipeline instance.
     """
     pipeline = Pipeline()
+    fetcher, processor = create_hn_summarizer_components(
+        api_key, model_name, temperature, verbose, max_concurrency, batch_size
+    )
 
     # Add HackerNewsNewestFetcher component
-    pipeline.add_component(
-        "hn_fetcher", HackerNewsNewestFetcher(verbose=verbose)
-    )
+    pipeline.add_component("hn_fetcher", fetcher)
 
     # Add DocumentLoopProcessor component
-    pipeline.add_component(
-        "document_processor",
-        DocumentLoopProcessor(api_key=api_key, model_name=model_name, temperature=temperature, verbose=verbose)
-    )
+    pipeline.add_component("document_processor", processor)
 
     # Connect the components
     pipeline.connect("hn_fetcher.documents", "document_processor.documents")